@@ -1,18 +1,18 @@
 """CLI interface for bmarxs."""
 
+import csv
+import functools
+import itertools
 import json
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 
-import browser_cookie3
 import click
-from rich.console import Console
-from rich.table import Table
 
 from . import __version__
-from .database import BookmarkDatabase
 from .errors import (
     AuthError,
     BrowserError,
@@ -21,9 +21,19 @@ from .errors import (
     ExitCode,
     NotFoundError,
 )
-from .formatters import format_bookmarks
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from .database import BookmarkDatabase
+
+
+@functools.cache
+def get_console() -> "Console":
+    """Get the shared Rich console (Rich is imported on first output)."""
+    from rich.console import Console
+
+    return Console()
 
 
 class CLIContext:
@@ -33,14 +43,20 @@ class CLIContext:
         self.data_dir = data_dir
         self.quiet = quiet
         self.json_output = json_output
+        # Decide once instead of re-checking the flags on every message
+        if quiet or json_output:
+            self.print = self._discard
 
     def print(self, message: str, style: str | None = None) -> None:
-        """Print message unless in quiet mode."""
-        if not self.quiet and not self.json_output:
-            if style:
-                console.print(f"[{style}]{message}[/{style}]")
-            else:
-                console.print(message)
+        """Print message (replaced by a no-op in quiet and JSON modes)."""
+        if style:
+            get_console().print(f"[{style}]{message}[/{style}]")
+        else:
+            get_console().print(message)
+
+    @staticmethod
+    def _discard(message: str, style: str | None = None) -> None:
+        """Drop a message; used as print in quiet and JSON modes."""
 
     def print_info(self, message: str) -> None:
         """Print info message."""
@@ -78,6 +94,38 @@ class CLIContext:
             self.output_json(result)
 
 
+# Playwright requires a sameSite value; Chrome's cookie store doesn't expose one
+COOKIE_SAME_SITE = "None"
+
+# Cookie domains to import. browser_cookie3 matches host_key with
+# LIKE '%.x.com%', which also matches hosts such as ".x.company.com", so
+# cookies are filtered again by suffix with is_x_cookie_domain.
+X_COOKIE_DOMAINS = (".x.com", ".twitter.com")
+
+
+def is_x_cookie_domain(domain: str) -> bool:
+    """Check whether a cookie domain is x.com/twitter.com or a subdomain."""
+    return ("." + domain.lstrip(".")).endswith(X_COOKIE_DOMAINS)
+
+
+def find_chrome_cookie_db() -> Path | None:
+    """
+    Locate the Default Chrome profile's cookie database.
+
+    Mirrors browser_cookie3's first lookup for stable Chrome without creating
+    a Chrome instance (which unlocks the keyring). Returns None when it isn't
+    there, leaving browser_cookie3 to search the other profiles uncached.
+    """
+    if sys.platform == "win32":
+        profile = Path(os.environ.get("LOCALAPPDATA", "")) / "Google" / "Chrome" / "User Data" / "Default"
+        candidates = [profile / "Cookies", profile / "Network" / "Cookies"]
+    elif sys.platform == "darwin":
+        candidates = [Path.home() / "Library/Application Support/Google/Chrome/Default/Cookies"]
+    else:
+        candidates = [Path.home() / ".config/google-chrome/Default/Cookies"]
+    return next((path for path in candidates if path.is_file()), None)
+
+
 def extract_x_cookies_from_chrome(ctx: CLIContext) -> list[dict]:
     """
     Extract X/Twitter cookies from Chrome browser.
@@ -85,39 +133,89 @@ def extract_x_cookies_from_chrome(ctx: CLIContext) -> list[dict]:
     Returns list of cookies in Playwright format.
     Chrome must be closed for this to work.
     """
-    playwright_cookies = []
+    import browser_cookie3
+
+    # Reuse the previous extraction while Chrome's cookie database is
+    # unchanged. The key comes from a plain stat of the file, so a cache hit
+    # never touches the keyring or the cookie store.
+    cache_file = get_cookie_cache_path(ctx.data_dir)
+    cache_key = None
+    cookies_db = find_chrome_cookie_db()
+    if cookies_db is not None:
+        stat = cookies_db.stat()
+        cache_key = [str(cookies_db), stat.st_mtime_ns, stat.st_size]
+
+    if cache_key and cache_file.exists():
+        try:
+            cached = json.loads(cache_file.read_text())
+            if cached.get("key") == cache_key:
+                ctx.print_info("Chrome cookies unchanged since last import, using cache")
+                return cached["cookies"]
+        except (OSError, ValueError, KeyError):
+            pass  # Corrupt cache, re-extract
+
+    chrome = None
+    try:
+        # One instance for every domain: locating the cookie DB and unwrapping
+        # the encryption key happen once here, not per domain. Pin it to the
+        # file the cache key was taken from.
+        chrome = browser_cookie3.Chrome(cookie_file=str(cookies_db) if cookies_db else None)
+    except Exception:
+        pass  # The per-domain extraction below reports why Chrome's cookies are unreadable
+
+    # Keyed like a cookie jar so cookies returned for both domains are kept once
+    playwright_cookies: dict[tuple[str, str, str], dict] = {}
 
-    for domain in [".x.com", ".twitter.com"]:
+    for domain in X_COOKIE_DOMAINS:
         try:
-            cj = browser_cookie3.chrome(domain_name=domain)
+            if chrome is None:
+                cj = browser_cookie3.chrome(domain_name=domain)
+            else:
+                chrome.domain_name = domain
+                cj = chrome.load()
             for cookie in cj:
-                playwright_cookies.append({
+                if not is_x_cookie_domain(cookie.domain):
+                    continue
+                playwright_cookies[(cookie.name, cookie.domain, cookie.path)] = {
                     "name": cookie.name,
                     "value": cookie.value,
                     "domain": cookie.domain,
                     "path": cookie.path,
                     "secure": bool(cookie.secure),
                     "httpOnly": bool(cookie.has_nonstandard_attr("HttpOnly")),
-                    "sameSite": "None",
+                    "sameSite": COOKIE_SAME_SITE,
                     "expires": cookie.expires if cookie.expires else -1,
-                })
+                }
         except Exception as e:
             ctx.print_warning(f"Warning: Could not read cookies for {domain}: {e}")
 
-    return playwright_cookies
+    cookies = [*playwright_cookies.values()]  # `list` is shadowed by the list command
+
+    if cache_key and cookies:
+        # The cache holds decrypted session cookies: owner-only, including
+        # files left behind with default permissions by older versions
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(cache_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        cache_file.chmod(0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps({"key": cache_key, "cookies": cookies}, separators=(",", ":")))
+
+    return cookies
 
 
 def validate_x_cookies(cookies: list[dict]) -> bool:
     """Check if essential X auth cookies are present."""
-    cookie_names = {c["name"] for c in cookies}
-    return "auth_token" in cookie_names
+    return any(c["name"] == "auth_token" for c in cookies)
 
 
 DEFAULT_DATA_DIR = Path("./data")
 
 
-def get_db(data_dir: Path) -> BookmarkDatabase:
-    """Get database instance."""
+@functools.lru_cache(maxsize=None)
+def get_db(data_dir: Path) -> "BookmarkDatabase":
+    """Get database instance (one per data directory per process)."""
+    from .database import BookmarkDatabase
+
     return BookmarkDatabase(data_dir / "bookmarks.db")
 
 
@@ -126,6 +224,11 @@ def get_session_path(data_dir: Path) -> Path:
     return data_dir / "session"
 
 
+def get_cookie_cache_path(data_dir: Path) -> Path:
+    """Get path of the cached Chrome cookie extraction."""
+    return data_dir / ".cookie_cache.json"
+
+
 def handle_error(ctx: CLIContext, error: CLIError) -> None:
     """Handle a CLI error with proper output and exit code."""
     if ctx.json_output:
@@ -138,6 +241,46 @@ def handle_error(ctx: CLIContext, error: CLIError) -> None:
     sys.exit(error.code)
 
 
+# Table output falls back to plain CSV rows above this many rows (or when
+# stdout is not a terminal): Rich measures every cell before printing anything
+PLAIN_TABLE_THRESHOLD = 500
+
+
+def use_plain_table(previews: Iterator) -> tuple[bool, Iterator]:
+    """
+    Check whether table output should bypass Rich rendering.
+
+    Reads ahead at most PLAIN_TABLE_THRESHOLD + 1 previews to size the
+    result, and returns the decision with an iterator over all previews.
+    """
+    if not get_console().is_terminal:
+        return True, previews
+    head = [*itertools.islice(previews, PLAIN_TABLE_THRESHOLD + 1)]
+    return len(head) > PLAIN_TABLE_THRESHOLD, itertools.chain(head, previews)
+
+
+def load_bookmarks(db: "BookmarkDatabase", output_format: str, filters: dict[str, Any]) -> Iterable:
+    """Fetch bookmarks in the cheapest form the output format accepts."""
+    if output_format == "jsonl":
+        return db.get_bookmark_json(**filters)  # Encoded by SQLite
+    if output_format in ("json", "csv"):
+        return db.get_bookmark_dicts(**filters)  # Skips Bookmark objects and date parsing
+    return db.get_all_bookmarks(**filters)
+
+
+def echo_stream(chunks: Iterable[str]) -> None:
+    """Write output chunks to stdout as they are produced."""
+    # Buffered writes rather than click.echo, which flushes on every call
+    sys.stdout.writelines(chunks)
+    end_stream()
+
+
+def end_stream() -> None:
+    """Finish streamed stdout output with a trailing newline, like click.echo."""
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+
+
 pass_context = click.make_pass_decorator(CLIContext)
 
 
@@ -230,13 +373,14 @@ def sync(ctx: CLIContext, sync_all: bool, visible: bool, enrich: bool, enrich_su
 @main.command()
 @click.option("--since", type=click.DateTime(), help="Only show bookmarks saved after this date")
 @click.option("--after-tweet", type=str, help="Only show bookmarks saved after this tweet ID")
+@click.option("--before-tweet", type=str, help="Page cursor: show bookmarks older than this tweet ID")
 @click.option("--author", type=str, help="Filter by author username")
 @click.option("--limit", type=int, help="Maximum number of bookmarks to show")
 @click.option("--unprocessed", is_flag=True, help="Only show unprocessed bookmarks")
 @click.option(
     "--format",
     "output_format",
-    type=click.Choice(["table", "json", "csv", "md"]),
+    type=click.Choice(["table", "json", "jsonl", "csv", "md"]),
     default="table",
     help="Output format (default: table)",
 )
@@ -245,30 +389,58 @@ def list(
     ctx: CLIContext,
     since: datetime | None,
     after_tweet: str | None,
+    before_tweet: str | None,
     author: str | None,
     limit: int | None,
     unprocessed: bool,
     output_format: str,
 ) -> None:
     """List bookmarks from the database."""
+    from .formatters import write_bookmarks
+
     db = get_db(ctx.data_dir)
 
+    # An unknown cursor would otherwise read as an empty last page
+    if before_tweet and not db.exists(before_tweet):
+        handle_error(ctx, NotFoundError(f"Bookmark {before_tweet} not found", {"before_tweet": before_tweet}))
+
     # Global --json flag overrides format
     if ctx.json_output:
         output_format = "json"
 
-    bookmarks = db.get_all_bookmarks(
-        limit=limit,
-        since=since,
-        after_tweet_id=after_tweet,
-        author=author,
-        unprocessed=unprocessed,
-    )
+    filters = {
+        "limit": limit,
+        "since": since,
+        "after_tweet_id": after_tweet,
+        "author": author,
+        "unprocessed": unprocessed,
+        "before_tweet_id": before_tweet,
+    }
 
     if output_format == "table":
         if ctx.quiet:
             return  # No output in quiet mode for table format
 
+        # Previews carry only the display columns, pre-formatted in SQL
+        previews = db.get_bookmark_previews(**filters)
+
+        plain, previews = use_plain_table(previews)
+        if plain:
+            writer = csv.writer(sys.stdout, lineterminator="\n")
+            writer.writerow(["author", "text", "created", "tweet_id", "processed"])
+            for preview in previews:
+                writer.writerow([
+                    f"@{preview.author_username}",
+                    preview.text_preview,
+                    preview.created_date,
+                    preview.tweet_id,
+                    "true" if preview.processed else "false",
+                ])
+            return
+
+        from rich.table import Table
+        from rich.text import Text
+
         table = Table(show_header=True, header_style="bold")
         table.add_column("Author", style="cyan")
         table.add_column("Text", max_width=60)
@@ -277,38 +449,34 @@ def list(
         table.add_column("Processed", style="dim")
 
         count = 0
-        for bookmark in bookmarks:
-            text = bookmark.text[:57] + "..." if len(bookmark.text) > 60 else bookmark.text
-            text = text.replace("\n", " ")
+        last_tweet_id = None
+        for preview in previews:
             table.add_row(
-                f"@{bookmark.author_username}",
-                text,
-                bookmark.created_at.strftime("%Y-%m-%d"),
-                bookmark.tweet_id,
-                "✓" if bookmark.processed else "",
+                f"@{preview.author_username}",
+                # One line per row: Rich cuts to the column width with an ellipsis
+                Text(preview.text_preview, no_wrap=True, overflow="ellipsis"),
+                preview.created_date,
+                preview.tweet_id,
+                "✓" if preview.processed else "",
             )
             count += 1
+            last_tweet_id = preview.tweet_id
 
-        console.print(table)
+        get_console().print(table)
         ctx.print_info(f"Showing {count} bookmarks")
+        if limit and count == limit:
+            ctx.print_info(f"Next page: --before-tweet {last_tweet_id}")
     else:
-        # Re-fetch since iterator was consumed
-        bookmarks = db.get_all_bookmarks(
-            limit=limit,
-            since=since,
-            after_tweet_id=after_tweet,
-            author=author,
-            unprocessed=unprocessed,
-        )
-        output = format_bookmarks(bookmarks, output_format)
-        click.echo(output)
+        bookmarks = load_bookmarks(db, output_format, filters)
+        write_bookmarks(bookmarks, output_format, sys.stdout)
+        end_stream()
 
 
 @main.command()
 @click.option(
     "--format",
     "output_format",
-    type=click.Choice(["json", "csv", "md"]),
+    type=click.Choice(["json", "jsonl", "csv", "md"]),
     default="json",
     help="Export format (default: json)",
 )
@@ -324,11 +492,14 @@ def export(
     unprocessed: bool,
 ) -> None:
     """Export bookmarks to stdout."""
+    from .formatters import write_bookmarks
+
     db = get_db(ctx.data_dir)
 
-    bookmarks = db.get_all_bookmarks(since=since, author=author, unprocessed=unprocessed)
-    formatted = format_bookmarks(bookmarks, output_format)
-    click.echo(formatted)
+    filters = {"since": since, "author": author, "unprocessed": unprocessed}
+    bookmarks = load_bookmarks(db, output_format, filters)
+    write_bookmarks(bookmarks, output_format, sys.stdout)
+    end_stream()
 
 
 @main.command()
@@ -342,14 +513,21 @@ def stats(ctx: CLIContext) -> None:
     if ctx.json_output:
         ctx.output_result(success=True, data=stats_data)
     elif not ctx.quiet:
+        console = get_console()
         console.print("\n[bold]Bookmark Statistics[/bold]\n")
         console.print(f"Total bookmarks: [cyan]{stats_data['total_bookmarks']}[/cyan]")
+        console.print(
+            f"Processed: [cyan]{stats_data['processed_bookmarks']}[/cyan]  "
+            f"Unprocessed: [cyan]{stats_data['unprocessed_bookmarks']}[/cyan]"
+        )
 
         if stats_data["oldest_bookmark"]:
             console.print(f"Oldest bookmark: [dim]{stats_data['oldest_bookmark']}[/dim]")
             console.print(f"Newest bookmark: [dim]{stats_data['newest_bookmark']}[/dim]")
 
         if stats_data["top_authors"]:
+            from rich.table import Table
+
             console.print("\n[bold]Top Authors:[/bold]")
             table = Table(show_header=True, header_style="bold")
             table.add_column("Author", style="cyan")
@@ -412,12 +590,29 @@ def search(ctx: CLIContext, query: str, limit: int | None, output_format: str) -
     if ctx.json_output:
         output_format = "json"
 
-    results = db.search(query, limit=limit)
-
     if output_format == "table":
         if ctx.quiet:
             return  # No output in quiet mode for table format
 
+        # Previews carry only the display columns, pre-formatted in SQL
+        previews = db.search_previews(query, limit=limit)
+
+        plain, previews = use_plain_table(previews)
+        if plain:
+            writer = csv.writer(sys.stdout, lineterminator="\n")
+            writer.writerow(["author", "text", "created", "tweet_id"])
+            for preview in previews:
+                writer.writerow([
+                    f"@{preview.author_username}",
+                    preview.text_preview,
+                    preview.created_date,
+                    preview.tweet_id,
+                ])
+            return
+
+        from rich.table import Table
+        from rich.text import Text
+
         table = Table(show_header=True, header_style="bold")
         table.add_column("Author", style="cyan")
         table.add_column("Text", max_width=60)
@@ -425,23 +620,23 @@ def search(ctx: CLIContext, query: str, limit: int | None, output_format: str) -
         table.add_column("Tweet ID", style="dim")
 
         count = 0
-        for bookmark in results:
-            text = bookmark.text[:57] + "..." if len(bookmark.text) > 60 else bookmark.text
-            text = text.replace("\n", " ")
+        for preview in previews:
             table.add_row(
-                f"@{bookmark.author_username}",
-                text,
-                bookmark.created_at.strftime("%Y-%m-%d"),
-                bookmark.tweet_id,
+                f"@{preview.author_username}",
+                # One line per row: Rich cuts to the column width with an ellipsis
+                Text(preview.text_preview, no_wrap=True, overflow="ellipsis"),
+                preview.created_date,
+                preview.tweet_id,
             )
             count += 1
 
-        console.print(table)
+        get_console().print(table)
         ctx.print_info(f"Found {count} results for '{query}'")
     else:
-        results = db.search(query, limit=limit)
-        bookmark_list = [b.to_dict() for b in results]
-        click.echo(json.dumps(bookmark_list, indent=2))
+        from .formatters import iter_json
+
+        # Search output has always escaped non-ASCII, unlike export
+        echo_stream(iter_json(db.search(query, limit=limit), ensure_ascii=True))
 
 
 @main.command("mark-processed")
@@ -455,14 +650,18 @@ def mark_processed(ctx: CLIContext, tweet_ids: tuple[str, ...]) -> None:
     success_count = 0
     failed_ids: list[str] = []
 
+    updated = db.mark_processed_many(tweet_ids)
+
     for tweet_id in tweet_ids:
-        if db.mark_processed(tweet_id):
+        if tweet_id in updated:
             success_count += 1
-            results.append({"tweet_id": tweet_id, "status": "processed"})
+            status = "processed"
         else:
             failed_ids.append(tweet_id)
-            results.append({"tweet_id": tweet_id, "status": "not_found"})
+            status = "not_found"
             ctx.print_warning(f"Warning: Bookmark {tweet_id} not found")
+        if ctx.json_output:
+            results.append({"tweet_id": tweet_id, "status": status})
 
     ctx.print_success(f"Marked {success_count} bookmark(s) as processed")
 
@@ -490,14 +689,18 @@ def mark_unprocessed(ctx: CLIContext, tweet_ids: tuple[str, ...]) -> None:
     success_count = 0
     failed_ids: list[str] = []
 
+    updated = db.mark_unprocessed_many(tweet_ids)
+
     for tweet_id in tweet_ids:
-        if db.mark_unprocessed(tweet_id):
+        if tweet_id in updated:
             success_count += 1
-            results.append({"tweet_id": tweet_id, "status": "unprocessed"})
+            status = "unprocessed"
         else:
             failed_ids.append(tweet_id)
-            results.append({"tweet_id": tweet_id, "status": "not_found"})
+            status = "not_found"
             ctx.print_warning(f"Warning: Bookmark {tweet_id} not found")
+        if ctx.json_output:
+            results.append({"tweet_id": tweet_id, "status": status})
 
     ctx.print_success(f"Marked {success_count} bookmark(s) as unprocessed")
 
@@ -515,8 +718,9 @@ def mark_unprocessed(ctx: CLIContext, tweet_ids: tuple[str, ...]) -> None:
 
 
 @main.command("import-cookies")
+@click.option("--pretty", is_flag=True, help="Indent the saved session file for human inspection")
 @pass_context
-def import_cookies(ctx: CLIContext) -> None:
+def import_cookies(ctx: CLIContext, pretty: bool) -> None:
     """Import cookies from Chrome browser (must be logged into X, Chrome must be closed)."""
     session_path = get_session_path(ctx.data_dir)
 
@@ -553,7 +757,11 @@ def import_cookies(ctx: CLIContext) -> None:
 
     session_path.mkdir(parents=True, exist_ok=True)
     state_file = session_path / "state.json"
-    state_file.write_text(json.dumps(storage_state, indent=2))
+    with state_file.open("w", encoding="utf-8") as f:
+        if pretty:
+            json.dump(storage_state, f, indent=2)
+        else:
+            json.dump(storage_state, f, separators=(",", ":"))
 
     ctx.print_success(f"Imported {len(cookies)} cookies!")
     ctx.print_info(f"Saved to {state_file}")
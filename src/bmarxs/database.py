@@ -2,13 +2,130 @@
 
 import json
 import sqlite3
+import threading
+import zlib
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Iterator
-
-
-@dataclass
+from typing import Iterable, Iterator, Sequence
+
+# Rows fetched per round-trip when streaming query results
+FETCH_BATCH_SIZE = 1000
+
+# Bound parameters per IN (...) list, under the historical
+# SQLITE_MAX_VARIABLE_NUMBER of 999
+MAX_SQL_VARIABLES = 900
+
+# Table listing columns, formatted in SQL so long tweet bodies never cross
+# into Python: text is cut to 60 chars (57 + "...") on one line, and the
+# date is the YYYY-MM-DD prefix of the ISO created_at
+PREVIEW_COLUMNS = """
+    b.tweet_id,
+    b.author_username,
+    replace(
+        CASE WHEN length(b.text) > 60 THEN substr(b.text, 1, 57) || '...' ELSE b.text END,
+        char(10), ' '
+    ) AS text_preview,
+    substr(b.created_at, 1, 10) AS created_date,
+    b.processed
+"""
+
+# Duplicates are skipped by the conflict clause rather than raising
+# IntegrityError, so cursor.rowcount reports whether each row was inserted
+INSERT_BOOKMARK_SQL = """
+    INSERT INTO bookmarks (
+        tweet_id, author_id, author_username, author_name,
+        text, created_at, bookmark_saved_at, raw_json,
+        media_urls, urls, processed, processed_at, url_metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(tweet_id) DO NOTHING
+"""
+
+# Fixed statements on per-bookmark paths, kept as constants so every call
+# passes identical text and hits the connection's statement cache
+EXISTS_SQL = "SELECT 1 FROM bookmarks WHERE tweet_id = ?"
+GET_BOOKMARK_SQL = "SELECT * FROM bookmarks WHERE tweet_id = ?"
+# processed_at is stamped by SQLite as naive local time, matching the
+# datetime.now().isoformat() values written by earlier versions
+NOW_SQL = "strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')"
+MARK_PROCESSED_SQL = f"UPDATE bookmarks SET processed = 1, processed_at = {NOW_SQL} WHERE tweet_id = ?"
+MARK_UNPROCESSED_SQL = "UPDATE bookmarks SET processed = 0, processed_at = NULL WHERE tweet_id = ?"
+UPDATE_URL_METADATA_SQL = "UPDATE bookmarks SET url_metadata = ? WHERE tweet_id = ?"
+
+# Columns behind get_bookmark_dicts: everything but raw_json, the full
+# GraphQL payload and by far the largest column, which exports never
+# include and would otherwise be decoded into a str for every row
+DICT_COLUMNS = """
+    b.tweet_id, b.author_id, b.author_username, b.author_name, b.text,
+    b.created_at, b.bookmark_saved_at, b.media_urls, b.urls,
+    b.processed, b.processed_at, b.url_metadata
+"""
+
+# One compact JSON object per row in the Bookmark.to_dict() shape, built by
+# SQLite's JSON1 writer; the JSON columns are inlined with json() instead of
+# being decoded into Python objects and re-encoded
+JSON_OBJECT_COLUMN = """
+    json_object(
+        'tweet_id', b.tweet_id,
+        'author_id', b.author_id,
+        'author_username', b.author_username,
+        'author_name', b.author_name,
+        'text', b.text,
+        'created_at', b.created_at,
+        'bookmark_saved_at', b.bookmark_saved_at,
+        'media_urls', json(nullif(b.media_urls, '')),
+        'urls', json(nullif(b.urls, '')),
+        'processed', json(CASE WHEN b.processed THEN 'true' ELSE 'false' END),
+        'processed_at', nullif(b.processed_at, ''),
+        'url_metadata', CASE WHEN b.url_metadata IN ('', '[]') THEN NULL ELSE json(b.url_metadata) END
+    )
+"""
+
+# Stored in PRAGMA user_version once the FTS index has been rebuilt and the
+# data migrations applied for the current schema; bump it when a migration
+# needs the index repopulated or existing rows rewritten.
+# 2: legacy NULL processed values normalized to 0
+SCHEMA_VERSION = 2
+
+# Per-connection tuning applied once when the connection is opened
+# (journal_mode=WAL is persistent and is set when the database is created)
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+# Encoder for the JSON stored in TEXT columns: compact separators, and built
+# once rather than per json.dumps call with non-default arguments
+_COMPACT_JSON = json.JSONEncoder(separators=(",", ":"))
+
+
+def dump_json(value: object) -> str:
+    """Serialize a value for a JSON column."""
+    return _COMPACT_JSON.encode(value)
+
+
+def pack_raw_json(text: str) -> bytes:
+    """Compress a tweet's raw JSON for the raw_json column."""
+    return zlib.compress(text.encode())
+
+
+def unpack_raw_json(value: str | bytes) -> str:
+    """Read a raw_json value: zlib BLOBs, or TEXT stored by earlier versions."""
+    return zlib.decompress(value).decode() if isinstance(value, bytes) else value
+
+
+def iter_rows(cursor: sqlite3.Cursor) -> Iterator[sqlite3.Row]:
+    """Stream a query's rows, fetching FETCH_BATCH_SIZE rows per call."""
+    cursor.arraysize = FETCH_BATCH_SIZE
+    while rows := cursor.fetchmany():
+        yield from rows
+
+
+@dataclass(slots=True)
 class UrlMetadata:
     """Metadata for an enriched URL."""
 
@@ -17,8 +134,23 @@ class UrlMetadata:
     description: str | None = None
     summary: str | None = None
 
+    def to_dict(self) -> dict:
+        """Convert metadata to dictionary."""
+        return {"url": self.url, "title": self.title, "description": self.description, "summary": self.summary}
+
+
+@dataclass(slots=True)
+class BookmarkPreview:
+    """Display-ready bookmark summary for table listings."""
+
+    tweet_id: str
+    author_username: str
+    text_preview: str
+    created_date: str
+    processed: bool
+
 
-@dataclass
+@dataclass(slots=True)
 class Bookmark:
     """Represents a bookmarked tweet."""
 
@@ -52,10 +184,7 @@ class Bookmark:
             "urls": self.urls,
             "processed": self.processed,
             "processed_at": self.processed_at.isoformat() if self.processed_at else None,
-            "url_metadata": [
-                {"url": m.url, "title": m.title, "description": m.description, "summary": m.summary}
-                for m in self.url_metadata
-            ] if self.url_metadata else None,
+            "url_metadata": [m.to_dict() for m in self.url_metadata] if self.url_metadata else None,
         }
 
 
@@ -64,109 +193,281 @@ class BookmarkDatabase:
 
     def __init__(self, db_path: Path):
         self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        # Serializes multi-statement write transactions across threads
+        self._write_lock = threading.Lock()
         self._ensure_db_exists()
 
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """The calling thread's connection, opened on first use and then reused."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection with the per-connection PRAGMAs applied.
+
+        Autocommit mode (isolation_level=None): single statements commit on
+        their own, and multi-statement writes use _transaction().
+        """
+        conn = sqlite3.connect(
+            self.db_path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a block of writes as one transaction, taking the write lock up front."""
+        conn = self._conn
+        with self._write_lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    def close(self) -> None:
+        """Close every thread's connection (they reopen on next use)."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for conn in connections:
+            conn.close()
+
+    def __del__(self) -> None:
+        # Attributes may be missing if __init__ failed part-way
+        if getattr(self, "_connections", None):
+            self.close()
+
     def _ensure_db_exists(self) -> None:
-        """Create database and tables if they don't exist."""
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        """Create tables, indexes and triggers if they don't exist."""
+        conn = self._conn
+        # WAL: one sequential append per commit, readers don't block writers
+        conn.execute("PRAGMA journal_mode=WAL")
+        # Deliberately a rowid table: bookmarks_fts is an external-content
+        # index keyed on rowid, which WITHOUT ROWID would remove. Timestamps
+        # stay ISO TEXT because created_at carries its UTC offset and exports
+        # round-trip the stored strings; ISO text also compares in order, so
+        # range filters and the indexes work on it directly. raw_json holds
+        # zlib-compressed BLOBs (a TEXT column keeps BLOBs as they are), so
+        # rows written before compression may still hold plain TEXT.
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS bookmarks (
+                tweet_id TEXT PRIMARY KEY,
+                author_id TEXT NOT NULL,
+                author_username TEXT NOT NULL,
+                author_name TEXT NOT NULL,
+                text TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                bookmark_saved_at TEXT NOT NULL,
+                raw_json TEXT NOT NULL,
+                media_urls TEXT,
+                urls TEXT,
+                processed INTEGER DEFAULT 0,
+                processed_at TEXT,
+                url_metadata TEXT
+            )
+        """)
+        # Serves the default listing order, since/keyset seeks, and (with
+        # tweet_id in the key) get_most_recent_tweet_id as a covering scan.
+        # It makes the single-column idx_bookmark_saved_at redundant.
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_saved_at_tweet_id
+            ON bookmarks(bookmark_saved_at DESC, tweet_id DESC)
+        """)
+        conn.execute("DROP INDEX IF EXISTS idx_bookmark_saved_at")
+        # Binary-collation author index: the author filter compares with
+        # COLLATE NOCASE and is served by idx_author_saved_at instead
+        conn.execute("DROP INDEX IF EXISTS idx_author_username")
+
+        # Run migrations for existing databases (adds new columns)
+        schema_version = conn.execute("PRAGMA user_version").fetchone()[0]
+        self._migrate_db(schema_version)
+
+        # Create indexes on new columns after migration
+        # Composite/partial indexes matching get_all_bookmarks filters, so
+        # author and unprocessed listings are index searches, not scans.
+        # idx_processed is superseded by the partial index (and would
+        # otherwise be picked for processed = 0, forcing a sort).
+        conn.execute("DROP INDEX IF EXISTS idx_processed")
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_author_saved_at
+            ON bookmarks(author_username COLLATE NOCASE, bookmark_saved_at DESC, tweet_id DESC)
+        """)
+        # processed is carried as a trailing column so unprocessed_count is a
+        # covering scan; older SQLite versions otherwise visit each table row
+        # to re-check the predicate. Replace the two-column version.
+        unprocessed_index_columns = conn.execute(
+            "PRAGMA index_info(idx_unprocessed_saved_at)"
+        ).fetchall()
+        if 0 < len(unprocessed_index_columns) < 3:
+            conn.execute("DROP INDEX idx_unprocessed_saved_at")
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_unprocessed_saved_at
+            ON bookmarks(bookmark_saved_at DESC, tweet_id DESC, processed) WHERE processed = 0
+        """)
+
+        # FTS5 full-text search table. Recreate it if it predates the
+        # current definition (with the unused tweet_id column); the rebuild
+        # below repopulates it from bookmarks.
+        fts_columns = {row[1] for row in conn.execute("PRAGMA table_info(bookmarks_fts)")}
+        if "tweet_id" in fts_columns:
+            for trigger in ("bookmarks_ai", "bookmarks_ad", "bookmarks_au"):
+                conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+            conn.execute("DROP TABLE bookmarks_fts")
+            fts_columns = set()
+        needs_rebuild = not fts_columns or schema_version < SCHEMA_VERSION
+
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS bookmarks_fts USING fts5(
+                text,
+                author_username,
+                author_name,
+                content='bookmarks',
+                content_rowid='rowid'
+            )
+        """)
+
+        # Triggers to keep FTS in sync
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS bookmarks_ai AFTER INSERT ON bookmarks BEGIN
+                INSERT INTO bookmarks_fts(rowid, text, author_username, author_name)
+                VALUES (NEW.rowid, NEW.text, NEW.author_username, NEW.author_name);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS bookmarks_ad AFTER DELETE ON bookmarks BEGIN
+                INSERT INTO bookmarks_fts(bookmarks_fts, rowid, text, author_username, author_name)
+                VALUES ('delete', OLD.rowid, OLD.text, OLD.author_username, OLD.author_name);
+            END
+        """)
+        # Only indexed columns: processed/url_metadata updates skip the FTS
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS bookmarks_au
+            AFTER UPDATE OF text, author_username, author_name ON bookmarks BEGIN
+                INSERT INTO bookmarks_fts(bookmarks_fts, rowid, text, author_username, author_name)
+                VALUES ('delete', OLD.rowid, OLD.text, OLD.author_username, OLD.author_name);
+                INSERT INTO bookmarks_fts(rowid, text, author_username, author_name)
+                VALUES (NEW.rowid, NEW.text, NEW.author_username, NEW.author_name);
+            END
+        """)
+
+        # Rebuild FTS index for existing data, only when the FTS table is
+        # new or the schema version is behind; the triggers keep it current
+        # otherwise
+        if needs_rebuild:
+            try:
+                conn.execute("INSERT INTO bookmarks_fts(bookmarks_fts) VALUES('rebuild')")
+            except sqlite3.OperationalError:
+                pass  # FTS table might be empty
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        self._ensure_stats_tables()
+
+    def _ensure_stats_tables(self) -> None:
+        """Create trigger-maintained aggregate tables used by get_stats."""
+        conn = self._conn
+        exists_sql = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'bookmark_stats'"
+        # Checked before taking any lock: opening an existing database must
+        # not need the write lock, or reads would wait on a running sync
+        if conn.execute(exists_sql).fetchone():
+            return
+
+        # Take the write lock up front so the backfill and the triggers
+        # see the same snapshot of bookmarks; re-check under the lock in
+        # case another process created the tables in the meantime.
+        # _transaction rolls back if any statement fails, so a failed
+        # open never leaves this connection holding the write lock.
+        with self._transaction() as conn:
+            if conn.execute(exists_sql).fetchone():
+                return
 
-        with sqlite3.connect(self.db_path) as conn:
             conn.execute("""
-                CREATE TABLE IF NOT EXISTS bookmarks (
-                    tweet_id TEXT PRIMARY KEY,
-                    author_id TEXT NOT NULL,
-                    author_username TEXT NOT NULL,
-                    author_name TEXT NOT NULL,
-                    text TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    bookmark_saved_at TEXT NOT NULL,
-                    raw_json TEXT NOT NULL,
-                    media_urls TEXT,
-                    urls TEXT,
-                    processed INTEGER DEFAULT 0,
-                    processed_at TEXT,
-                    url_metadata TEXT
+                CREATE TABLE bookmark_stats (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    total INTEGER NOT NULL
                 )
             """)
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_bookmark_saved_at
-                ON bookmarks(bookmark_saved_at DESC)
+                CREATE TABLE IF NOT EXISTS author_counts (
+                    username TEXT PRIMARY KEY,
+                    count INTEGER NOT NULL
+                )
             """)
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_author_username
-                ON bookmarks(author_username)
+                CREATE INDEX IF NOT EXISTS idx_author_counts_count
+                ON author_counts(count DESC, username)
             """)
-            conn.commit()
-
-        # Run migrations for existing databases (adds new columns)
-        self._migrate_db()
 
-        # Create indexes on new columns after migration
-        with sqlite3.connect(self.db_path) as conn:
+            # Backfill from existing data
+            conn.execute("INSERT INTO bookmark_stats (id, total) SELECT 1, COUNT(*) FROM bookmarks")
+            conn.execute("DELETE FROM author_counts")
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_processed
-                ON bookmarks(processed)
+                INSERT INTO author_counts (username, count)
+                SELECT author_username, COUNT(*) FROM bookmarks GROUP BY author_username
             """)
 
-            # FTS5 full-text search table
+            # Triggers to keep aggregates in sync
             conn.execute("""
-                CREATE VIRTUAL TABLE IF NOT EXISTS bookmarks_fts USING fts5(
-                    tweet_id,
-                    text,
-                    author_username,
-                    author_name,
-                    content='bookmarks',
-                    content_rowid='rowid'
-                )
-            """)
-
-            # Triggers to keep FTS in sync
-            conn.execute("""
-                CREATE TRIGGER IF NOT EXISTS bookmarks_ai AFTER INSERT ON bookmarks BEGIN
-                    INSERT INTO bookmarks_fts(rowid, tweet_id, text, author_username, author_name)
-                    VALUES (NEW.rowid, NEW.tweet_id, NEW.text, NEW.author_username, NEW.author_name);
+                CREATE TRIGGER IF NOT EXISTS bookmarks_stats_ai AFTER INSERT ON bookmarks BEGIN
+                    UPDATE bookmark_stats SET total = total + 1 WHERE id = 1;
+                    INSERT INTO author_counts (username, count) VALUES (NEW.author_username, 1)
+                    ON CONFLICT(username) DO UPDATE SET count = count + 1;
                 END
             """)
             conn.execute("""
-                CREATE TRIGGER IF NOT EXISTS bookmarks_ad AFTER DELETE ON bookmarks BEGIN
-                    INSERT INTO bookmarks_fts(bookmarks_fts, rowid, tweet_id, text, author_username, author_name)
-                    VALUES ('delete', OLD.rowid, OLD.tweet_id, OLD.text, OLD.author_username, OLD.author_name);
+                CREATE TRIGGER IF NOT EXISTS bookmarks_stats_ad AFTER DELETE ON bookmarks BEGIN
+                    UPDATE bookmark_stats SET total = total - 1 WHERE id = 1;
+                    UPDATE author_counts SET count = count - 1 WHERE username = OLD.author_username;
+                    DELETE FROM author_counts WHERE username = OLD.author_username AND count <= 0;
                 END
             """)
             conn.execute("""
-                CREATE TRIGGER IF NOT EXISTS bookmarks_au AFTER UPDATE ON bookmarks BEGIN
-                    INSERT INTO bookmarks_fts(bookmarks_fts, rowid, tweet_id, text, author_username, author_name)
-                    VALUES ('delete', OLD.rowid, OLD.tweet_id, OLD.text, OLD.author_username, OLD.author_name);
-                    INSERT INTO bookmarks_fts(rowid, tweet_id, text, author_username, author_name)
-                    VALUES (NEW.rowid, NEW.tweet_id, NEW.text, NEW.author_username, NEW.author_name);
+                CREATE TRIGGER IF NOT EXISTS bookmarks_stats_au
+                AFTER UPDATE OF author_username ON bookmarks
+                WHEN OLD.author_username IS NOT NEW.author_username BEGIN
+                    UPDATE author_counts SET count = count - 1 WHERE username = OLD.author_username;
+                    DELETE FROM author_counts WHERE username = OLD.author_username AND count <= 0;
+                    INSERT INTO author_counts (username, count) VALUES (NEW.author_username, 1)
+                    ON CONFLICT(username) DO UPDATE SET count = count + 1;
                 END
             """)
 
-            conn.commit()
-
-            # Rebuild FTS index for existing data
-            try:
-                conn.execute("INSERT INTO bookmarks_fts(bookmarks_fts) VALUES('rebuild')")
-                conn.commit()
-            except sqlite3.OperationalError:
-                pass  # FTS table might be empty
-
-    def _migrate_db(self) -> None:
-        """Add new columns to existing databases."""
-        with sqlite3.connect(self.db_path) as conn:
-            # Get existing columns
-            cursor = conn.execute("PRAGMA table_info(bookmarks)")
-            existing_columns = {row[1] for row in cursor.fetchall()}
-
-            # Add missing columns
-            if "processed" not in existing_columns:
-                conn.execute("ALTER TABLE bookmarks ADD COLUMN processed INTEGER DEFAULT 0")
-            if "processed_at" not in existing_columns:
-                conn.execute("ALTER TABLE bookmarks ADD COLUMN processed_at TEXT")
-            if "url_metadata" not in existing_columns:
-                conn.execute("ALTER TABLE bookmarks ADD COLUMN url_metadata TEXT")
-
-            conn.commit()
+    def _migrate_db(self, schema_version: int) -> None:
+        """Add new columns to existing databases and normalize old rows."""
+        conn = self._conn
+        # Get existing columns
+        cursor = conn.execute("PRAGMA table_info(bookmarks)")
+        existing_columns = {row[1] for row in cursor.fetchall()}
+
+        # Add missing columns
+        if "processed" not in existing_columns:
+            conn.execute("ALTER TABLE bookmarks ADD COLUMN processed INTEGER DEFAULT 0")
+        if "processed_at" not in existing_columns:
+            conn.execute("ALTER TABLE bookmarks ADD COLUMN processed_at TEXT")
+        if "url_metadata" not in existing_columns:
+            conn.execute("ALTER TABLE bookmarks ADD COLUMN url_metadata TEXT")
+
+        # Rows written before processed had a default can hold NULL; the
+        # unprocessed filter and idx_unprocessed_saved_at only match 0
+        if schema_version < 2:
+            conn.execute("UPDATE bookmarks SET processed = 0 WHERE processed IS NULL")
 
     def save_bookmark(self, bookmark: Bookmark) -> bool:
         """
@@ -174,72 +475,65 @@ class BookmarkDatabase:
 
         Returns True if inserted, False if already exists.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            try:
-                url_metadata_json = None
-                if bookmark.url_metadata:
-                    url_metadata_json = json.dumps([
-                        {"url": m.url, "title": m.title, "description": m.description, "summary": m.summary}
-                        for m in bookmark.url_metadata
-                    ])
-
-                conn.execute(
-                    """
-                    INSERT INTO bookmarks (
-                        tweet_id, author_id, author_username, author_name,
-                        text, created_at, bookmark_saved_at, raw_json,
-                        media_urls, urls, processed, processed_at, url_metadata
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        bookmark.tweet_id,
-                        bookmark.author_id,
-                        bookmark.author_username,
-                        bookmark.author_name,
-                        bookmark.text,
-                        bookmark.created_at.isoformat(),
-                        bookmark.bookmark_saved_at.isoformat(),
-                        bookmark.raw_json,
-                        json.dumps(bookmark.media_urls) if bookmark.media_urls else None,
-                        json.dumps(bookmark.urls) if bookmark.urls else None,
-                        1 if bookmark.processed else 0,
-                        bookmark.processed_at.isoformat() if bookmark.processed_at else None,
-                        url_metadata_json,
-                    ),
-                )
-                conn.commit()
-                return True
-            except sqlite3.IntegrityError:
-                return False
+        cursor = self._conn.execute(INSERT_BOOKMARK_SQL, self._bookmark_to_row(bookmark))
+        return cursor.rowcount > 0
+
+    def save_bookmarks(self, bookmarks: Iterable[Bookmark]) -> int:
+        """
+        Save many bookmarks in a single transaction.
+
+        Bookmarks that already exist are skipped. Returns the number inserted.
+        """
+        with self._transaction() as conn:
+            cursor = conn.executemany(
+                INSERT_BOOKMARK_SQL,
+                (self._bookmark_to_row(bookmark) for bookmark in bookmarks),
+            )
+            return cursor.rowcount
+
+    def _bookmark_to_row(self, bookmark: Bookmark) -> tuple:
+        """Convert a Bookmark object to INSERT_BOOKMARK_SQL parameters."""
+        return (
+            bookmark.tweet_id,
+            bookmark.author_id,
+            bookmark.author_username,
+            bookmark.author_name,
+            bookmark.text,
+            bookmark.created_at.isoformat(),
+            bookmark.bookmark_saved_at.isoformat(),
+            pack_raw_json(bookmark.raw_json),
+            dump_json(bookmark.media_urls) if bookmark.media_urls else None,
+            dump_json(bookmark.urls) if bookmark.urls else None,
+            1 if bookmark.processed else 0,
+            bookmark.processed_at.isoformat() if bookmark.processed_at else None,
+            dump_json([m.to_dict() for m in bookmark.url_metadata]) if bookmark.url_metadata else None,
+        )
 
     def exists(self, tweet_id: str) -> bool:
         """Check if a bookmark exists in the database."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "SELECT 1 FROM bookmarks WHERE tweet_id = ?",
-                (tweet_id,),
-            )
-            return cursor.fetchone() is not None
+        cursor = self._conn.execute(EXISTS_SQL, (tweet_id,))
+        return cursor.fetchone() is not None
+
+    def get_all_tweet_ids(self) -> set[str]:
+        """Return the IDs of all stored bookmarks."""
+        # Read straight from the primary key index; rows are never touched
+        cursor = self._conn.execute("SELECT tweet_id FROM bookmarks")
+        return {row[0] for row in iter_rows(cursor)}
 
     def get_most_recent_tweet_id(self) -> str | None:
         """Get the most recently saved bookmark's tweet ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "SELECT tweet_id FROM bookmarks ORDER BY bookmark_saved_at DESC LIMIT 1"
-            )
-            row = cursor.fetchone()
-            return row[0] if row else None
+        conn = self._conn
+        cursor = conn.execute(
+            "SELECT tweet_id FROM bookmarks ORDER BY bookmark_saved_at DESC LIMIT 1"
+        )
+        row = cursor.fetchone()
+        return row[0] if row else None
 
     def get_bookmark(self, tweet_id: str) -> Bookmark | None:
         """Get a single bookmark by tweet ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT * FROM bookmarks WHERE tweet_id = ?",
-                (tweet_id,),
-            )
-            row = cursor.fetchone()
-            return self._row_to_bookmark(row) if row else None
+        cursor = self._conn.execute(GET_BOOKMARK_SQL, (tweet_id,))
+        row = cursor.fetchone()
+        return self._row_to_bookmark(row) if row else None
 
     def get_all_bookmarks(
         self,
@@ -248,16 +542,117 @@ class BookmarkDatabase:
         after_tweet_id: str | None = None,
         author: str | None = None,
         unprocessed: bool = False,
+        before_tweet_id: str | None = None,
     ) -> Iterator[Bookmark]:
         """
         Get bookmarks with optional filters.
 
+        Results are ordered newest first by (bookmark_saved_at, tweet_id).
+
         Args:
             limit: Maximum number of bookmarks to return
             since: Only return bookmarks saved after this datetime
             after_tweet_id: Only return bookmarks saved after this tweet
             author: Filter by author username
             unprocessed: Only return unprocessed bookmarks
+            before_tweet_id: Keyset cursor - only return bookmarks older than
+                this tweet in list order (i.e. the next page); an unknown
+                tweet ID matches nothing
+        """
+        for row in self._list_rows(
+            "b.*", limit, since, after_tweet_id, author, unprocessed, before_tweet_id
+        ):
+            yield self._row_to_bookmark(row)
+
+    def get_bookmark_previews(
+        self,
+        limit: int | None = None,
+        since: datetime | None = None,
+        after_tweet_id: str | None = None,
+        author: str | None = None,
+        unprocessed: bool = False,
+        before_tweet_id: str | None = None,
+    ) -> Iterator[BookmarkPreview]:
+        """Get table previews of bookmarks; same filters and order as get_all_bookmarks."""
+        for row in self._list_rows(
+            PREVIEW_COLUMNS, limit, since, after_tweet_id, author, unprocessed, before_tweet_id
+        ):
+            yield BookmarkPreview(*row[:4], processed=bool(row[4]))
+
+    def get_bookmark_dicts(
+        self,
+        limit: int | None = None,
+        since: datetime | None = None,
+        after_tweet_id: str | None = None,
+        author: str | None = None,
+        unprocessed: bool = False,
+        before_tweet_id: str | None = None,
+    ) -> Iterator[dict]:
+        """
+        Get bookmarks as Bookmark.to_dict()-shaped dicts; same filters and
+        order as get_all_bookmarks.
+
+        Built straight from the stored columns: timestamps are already ISO
+        strings, so no datetime or Bookmark objects are created.
+        """
+        for row in self._list_rows(
+            DICT_COLUMNS, limit, since, after_tweet_id, author, unprocessed, before_tweet_id
+        ):
+            yield self._row_to_dict(row)
+
+    def get_bookmark_json(
+        self,
+        limit: int | None = None,
+        since: datetime | None = None,
+        after_tweet_id: str | None = None,
+        author: str | None = None,
+        unprocessed: bool = False,
+        before_tweet_id: str | None = None,
+    ) -> Iterator[str]:
+        """
+        Get bookmarks as compact JSON object strings, encoded by SQLite;
+        same filters and order as get_all_bookmarks.
+        """
+        for row in self._list_rows(
+            JSON_OBJECT_COLUMN, limit, since, after_tweet_id, author, unprocessed, before_tweet_id
+        ):
+            yield row[0]
+
+    def _list_rows(
+        self,
+        columns: str,
+        limit: int | None,
+        since: datetime | None,
+        after_tweet_id: str | None,
+        author: str | None,
+        unprocessed: bool,
+        before_tweet_id: str | None,
+    ) -> Iterator[sqlite3.Row]:
+        """Run the filtered bookmark listing query, streaming rows in batches."""
+        where_clause, params = self._filter_clause(
+            since, after_tweet_id, author, unprocessed, before_tweet_id
+        )
+        query = (
+            f"SELECT {columns} FROM bookmarks b WHERE {where_clause} "
+            "ORDER BY bookmark_saved_at DESC, tweet_id DESC LIMIT ?"
+        )
+
+        return iter_rows(self._conn.execute(query, (*params, limit or -1)))
+
+    def _filter_clause(
+        self,
+        since: datetime | None,
+        after_tweet_id: str | None,
+        author: str | None,
+        unprocessed: bool,
+        before_tweet_id: str | None,
+    ) -> tuple[str, list]:
+        """
+        Build the WHERE clause and parameters for bookmark list filters.
+
+        Values are always bound, never interpolated, so the SQL text depends
+        only on which filters are set and each combination is prepared once
+        and then served from the connection's statement cache.
         """
         conditions = []
         params: list = []
@@ -267,76 +662,91 @@ class BookmarkDatabase:
             params.append(since.isoformat())
 
         if after_tweet_id:
-            # Get the bookmark_saved_at for this tweet
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    "SELECT bookmark_saved_at FROM bookmarks WHERE tweet_id = ?",
-                    (after_tweet_id,),
-                )
-                row = cursor.fetchone()
-                if row:
-                    conditions.append("bookmark_saved_at > ?")
-                    params.append(row[0])
+            # Resolved inside the query (one primary key lookup) instead of
+            # a separate round-trip; an unknown tweet ID leaves the filter off
+            conditions.append(
+                "bookmark_saved_at > coalesce("
+                "(SELECT bookmark_saved_at FROM bookmarks WHERE tweet_id = ?), '')"
+            )
+            params.append(after_tweet_id)
+
+        if before_tweet_id:
+            # Keyset pagination: seek past the cursor row via the index
+            # instead of re-reading and discarding earlier pages. An unknown
+            # cursor compares against NULL and matches nothing, so callers
+            # check it exists first
+            conditions.append(
+                "(bookmark_saved_at, tweet_id) < "
+                "(SELECT bookmark_saved_at, tweet_id FROM bookmarks WHERE tweet_id = ?)"
+            )
+            params.append(before_tweet_id)
 
         if author:
-            conditions.append("LOWER(author_username) = LOWER(?)")
+            # COLLATE NOCASE (not LOWER()) so idx_author_saved_at applies
+            conditions.append("author_username = ? COLLATE NOCASE")
             params.append(author)
 
         if unprocessed:
-            conditions.append("(processed = 0 OR processed IS NULL)")
+            # Must match the idx_unprocessed_saved_at predicate exactly; no
+            # OR processed IS NULL needed since _migrate_db normalizes NULLs
+            conditions.append("processed = 0")
 
         where_clause = " AND ".join(conditions) if conditions else "1=1"
-        query = f"SELECT * FROM bookmarks WHERE {where_clause} ORDER BY bookmark_saved_at DESC"
-
-        if limit:
-            query += f" LIMIT {limit}"
-
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(query, params)
-            for row in cursor:
-                yield self._row_to_bookmark(row)
+        return where_clause, params
 
     def count(self) -> int:
         """Get total number of bookmarks."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM bookmarks")
-            return cursor.fetchone()[0]
+        conn = self._conn
+        cursor = conn.execute("SELECT total FROM bookmark_stats WHERE id = 1")
+        return cursor.fetchone()[0]
+
+    def unprocessed_count(self) -> int:
+        """Get number of unprocessed bookmarks."""
+        # Covering scan of idx_unprocessed_saved_at, which only holds these rows
+        cursor = self._conn.execute("SELECT COUNT(*) FROM bookmarks WHERE processed = 0")
+        return cursor.fetchone()[0]
 
     def get_stats(self) -> dict:
-        """Get statistics about the bookmarks."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-
-            # Total count
-            total = conn.execute("SELECT COUNT(*) as count FROM bookmarks").fetchone()["count"]
-
-            # Date range
-            dates = conn.execute("""
-                SELECT
-                    MIN(bookmark_saved_at) as oldest,
-                    MAX(bookmark_saved_at) as newest
-                FROM bookmarks
-            """).fetchone()
-
-            # Top authors
-            top_authors = conn.execute("""
-                SELECT author_username, COUNT(*) as count
-                FROM bookmarks
-                GROUP BY author_username
-                ORDER BY count DESC
-                LIMIT 10
-            """).fetchall()
-
-            return {
-                "total_bookmarks": total,
-                "oldest_bookmark": dates["oldest"],
-                "newest_bookmark": dates["newest"],
-                "top_authors": [
-                    {"username": row["author_username"], "count": row["count"]}
-                    for row in top_authors
-                ],
-            }
+        """
+        Get statistics about the bookmarks.
+
+        Totals and author counts are maintained by triggers, the date
+        range is two index lookups and the unprocessed count is a covering
+        scan of the partial index, so this does not read the table.
+        """
+        conn = self._conn
+
+        # Total and date range in one statement
+        totals = conn.execute("""
+            SELECT
+                total,
+                (SELECT MIN(bookmark_saved_at) FROM bookmarks) as oldest,
+                (SELECT MAX(bookmark_saved_at) FROM bookmarks) as newest
+            FROM bookmark_stats
+            WHERE id = 1
+        """).fetchone()
+
+        # Top authors
+        top_authors = conn.execute("""
+            SELECT username, count
+            FROM author_counts
+            ORDER BY count DESC, username
+            LIMIT 10
+        """).fetchall()
+
+        unprocessed = self.unprocessed_count()
+
+        return {
+            "total_bookmarks": totals["total"],
+            "processed_bookmarks": totals["total"] - unprocessed,
+            "unprocessed_bookmarks": unprocessed,
+            "oldest_bookmark": totals["oldest"],
+            "newest_bookmark": totals["newest"],
+            "top_authors": [
+                {"username": row["username"], "count": row["count"]}
+                for row in top_authors
+            ],
+        }
 
     def _row_to_bookmark(self, row: sqlite3.Row) -> Bookmark:
         """Convert a database row to a Bookmark object."""
@@ -362,7 +772,7 @@ class BookmarkDatabase:
             text=row["text"],
             created_at=datetime.fromisoformat(row["created_at"]),
             bookmark_saved_at=datetime.fromisoformat(row["bookmark_saved_at"]),
-            raw_json=row["raw_json"],
+            raw_json=unpack_raw_json(row["raw_json"]),
             media_urls=json.loads(row["media_urls"]) if row["media_urls"] else None,
             urls=json.loads(row["urls"]) if row["urls"] else None,
             processed=bool(row["processed"]) if row["processed"] is not None else False,
@@ -370,23 +780,43 @@ class BookmarkDatabase:
             url_metadata=url_metadata,
         )
 
+    def _row_to_dict(self, row: sqlite3.Row) -> dict:
+        """Convert a database row to the Bookmark.to_dict() shape."""
+        url_metadata = None
+        if row["url_metadata"]:
+            url_metadata = [
+                {
+                    "url": m["url"],
+                    "title": m.get("title"),
+                    "description": m.get("description"),
+                    "summary": m.get("summary"),
+                }
+                for m in json.loads(row["url_metadata"])
+            ]
+
+        return {
+            "tweet_id": row["tweet_id"],
+            "author_id": row["author_id"],
+            "author_username": row["author_username"],
+            "author_name": row["author_name"],
+            "text": row["text"],
+            "created_at": row["created_at"],
+            "bookmark_saved_at": row["bookmark_saved_at"],
+            "media_urls": json.loads(row["media_urls"]) if row["media_urls"] else None,
+            "urls": json.loads(row["urls"]) if row["urls"] else None,
+            "processed": bool(row["processed"]) if row["processed"] is not None else False,
+            "processed_at": row["processed_at"] or None,
+            "url_metadata": url_metadata or None,
+        }
+
     def mark_processed(self, tweet_id: str) -> bool:
         """
         Mark a bookmark as processed.
 
         Returns True if updated, False if bookmark not found.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                """
-                UPDATE bookmarks
-                SET processed = 1, processed_at = ?
-                WHERE tweet_id = ?
-                """,
-                (datetime.now().isoformat(), tweet_id),
-            )
-            conn.commit()
-            return cursor.rowcount > 0
+        cursor = self._conn.execute(MARK_PROCESSED_SQL, (tweet_id,))
+        return cursor.rowcount > 0
 
     def mark_unprocessed(self, tweet_id: str) -> bool:
         """
@@ -394,17 +824,46 @@ class BookmarkDatabase:
 
         Returns True if updated, False if bookmark not found.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                """
-                UPDATE bookmarks
-                SET processed = 0, processed_at = NULL
-                WHERE tweet_id = ?
-                """,
-                (tweet_id,),
-            )
-            conn.commit()
-            return cursor.rowcount > 0
+        cursor = self._conn.execute(MARK_UNPROCESSED_SQL, (tweet_id,))
+        return cursor.rowcount > 0
+
+    def mark_processed_many(self, tweet_ids: Sequence[str]) -> set[str]:
+        """
+        Mark several bookmarks as processed in a single transaction.
+
+        Returns the set of tweet IDs that were found and updated.
+        """
+        return self._set_processed_many(tweet_ids, processed=True)
+
+    def mark_unprocessed_many(self, tweet_ids: Sequence[str]) -> set[str]:
+        """
+        Mark several bookmarks as unprocessed in a single transaction.
+
+        Returns the set of tweet IDs that were found and updated.
+        """
+        return self._set_processed_many(tweet_ids, processed=False)
+
+    def _set_processed_many(self, tweet_ids: Sequence[str], processed: bool) -> set[str]:
+        """Update processing state for many bookmarks in one transaction."""
+        processed_at = NOW_SQL if processed else "NULL"
+        found: set[str] = set()
+
+        with self._transaction() as conn:
+            # RETURNING reports the matched rows, so no separate lookup is needed
+            for start in range(0, len(tweet_ids), MAX_SQL_VARIABLES):
+                chunk = tweet_ids[start:start + MAX_SQL_VARIABLES]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = conn.execute(
+                    f"""
+                    UPDATE bookmarks
+                    SET processed = ?, processed_at = {processed_at}
+                    WHERE tweet_id IN ({placeholders})
+                    RETURNING tweet_id
+                    """,
+                    (1 if processed else 0, *chunk),
+                )
+                found.update(row[0] for row in cursor.fetchall())
+        return found
 
     def search(self, query: str, limit: int | None = None) -> Iterator[Bookmark]:
         """
@@ -414,21 +873,30 @@ class BookmarkDatabase:
             query: Search query (supports FTS5 syntax)
             limit: Maximum number of results
         """
-        sql = """
-            SELECT b.*
-            FROM bookmarks b
-            JOIN bookmarks_fts fts ON b.tweet_id = fts.tweet_id
+        cursor = self._conn.execute(self._search_sql("b.*"), (query, limit or -1))
+        for row in iter_rows(cursor):
+            yield self._row_to_bookmark(row)
+
+    def search_previews(self, query: str, limit: int | None = None) -> Iterator[BookmarkPreview]:
+        """Full-text search returning table previews; same matching as search."""
+        cursor = self._conn.execute(self._search_sql(PREVIEW_COLUMNS), (query, limit or -1))
+        for row in iter_rows(cursor):
+            yield BookmarkPreview(*row[:4], processed=bool(row[4]))
+
+    def _search_sql(self, columns: str) -> str:
+        """Build the full-text search query selecting the given columns."""
+        # Drive the query from the FTS index and join back on rowid (the
+        # external-content key) rather than the tweet_id text column, which
+        # the FTS table can only produce by reading back from bookmarks
+        # The limit is bound (-1 for none) so each column set is one cached statement
+        return f"""
+            SELECT {columns}
+            FROM bookmarks_fts
+            JOIN bookmarks b ON b.rowid = bookmarks_fts.rowid
             WHERE bookmarks_fts MATCH ?
-            ORDER BY rank
+            ORDER BY bookmarks_fts.rank
+            LIMIT ?
         """
-        if limit:
-            sql += f" LIMIT {limit}"
-
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(sql, (query,))
-            for row in cursor:
-                yield self._row_to_bookmark(row)
 
     def update_url_metadata(self, tweet_id: str, url_metadata: list[UrlMetadata]) -> bool:
         """
@@ -436,15 +904,7 @@ class BookmarkDatabase:
 
         Returns True if updated, False if bookmark not found.
         """
-        url_metadata_json = json.dumps([
-            {"url": m.url, "title": m.title, "description": m.description, "summary": m.summary}
-            for m in url_metadata
-        ])
-
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "UPDATE bookmarks SET url_metadata = ? WHERE tweet_id = ?",
-                (url_metadata_json, tweet_id),
-            )
-            conn.commit()
-            return cursor.rowcount > 0
+        url_metadata_json = dump_json([m.to_dict() for m in url_metadata])
+
+        cursor = self._conn.execute(UPDATE_URL_METADATA_SQL, (url_metadata_json, tweet_id))
+        return cursor.rowcount > 0
@@ -1,10 +1,12 @@
 """URL enrichment for bookmark metadata."""
 
+import asyncio
 import re
+from functools import lru_cache
 from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from rich.console import Console
 
 from .database import BookmarkDatabase, UrlMetadata
@@ -12,11 +14,22 @@ from .database import BookmarkDatabase, UrlMetadata
 console = Console()
 
 # Skip these domains for enrichment (Twitter/X internal links)
-SKIP_DOMAINS = {"twitter.com", "x.com", "t.co", "pic.twitter.com"}
+SKIP_DOMAINS = frozenset({"twitter.com", "x.com", "t.co", "pic.twitter.com"})
+SKIP_PREFIXES = tuple(
+    f"{scheme}://{domain}/" for scheme in ("https", "http") for domain in SKIP_DOMAINS
+)
+
+# Metadata normally lives in <head>: parse only up to its end (falling back
+# to the whole page when nothing is found there), and only these tags
+HEAD_END_RE = re.compile(r"</head\s*>", re.IGNORECASE)
+METADATA_TAGS = SoupStrainer(["title", "meta"])
 
 # Request timeout
 TIMEOUT = 10.0
 
+# Maximum URLs fetched at once by enrich_all_bookmarks
+CONCURRENCY = 16
+
 # User agent for requests
 USER_AGENT = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -25,8 +38,12 @@ USER_AGENT = (
 )
 
 
+@lru_cache(maxsize=4096)
 def should_enrich_url(url: str) -> bool:
     """Check if URL should be enriched (not a Twitter/X internal link)."""
+    # Most skipped links are plain https://x.com/... or https://t.co/... URLs
+    if url.startswith(SKIP_PREFIXES):
+        return False
     try:
         parsed = urlparse(url)
         domain = parsed.netloc.lower()
@@ -40,7 +57,22 @@ def should_enrich_url(url: str) -> bool:
 
 def extract_metadata(html: str, url: str) -> UrlMetadata:
     """Extract title and description from HTML."""
-    soup = BeautifulSoup(html, "html.parser")
+    head_end = HEAD_END_RE.search(html)
+    if head_end:
+        title, description = _find_metadata(html[:head_end.start()])
+        # Some pages close <head> early (or emit a stray </head>) and put
+        # their tags after it: fall back to the whole document
+        if not title and not description:
+            title, description = _find_metadata(html)
+    else:
+        title, description = _find_metadata(html)
+
+    return UrlMetadata(url=url, title=title, description=description)
+
+
+def _find_metadata(html: str) -> tuple[str | None, str | None]:
+    """Find the title and description among the <title> and <meta> tags."""
+    soup = BeautifulSoup(html, "html.parser", parse_only=METADATA_TAGS)
 
     # Try Open Graph tags first, then fall back to regular tags
     title = None
@@ -68,7 +100,7 @@ def extract_metadata(html: str, url: str) -> UrlMetadata:
         if meta_desc and meta_desc.get("content"):
             description = meta_desc["content"]
 
-    return UrlMetadata(url=url, title=title, description=description)
+    return title, description
 
 
 def extract_page_text(html: str) -> str:
@@ -82,8 +114,8 @@ def extract_page_text(html: str) -> str:
     # Get text
     text = soup.get_text(separator=" ", strip=True)
 
-    # Clean up whitespace
-    text = re.sub(r"\s+", " ", text)
+    # Collapse runs of whitespace
+    text = " ".join(text.split())
 
     # Limit length for summarization
     return text[:10000]
@@ -113,21 +145,44 @@ def fetch_url_metadata(
                 headers={"User-Agent": USER_AGENT},
             )
             response.raise_for_status()
+            return metadata_from_html(response.text, url, include_summary)
+
+    except Exception as e:
+        console.print(f"[dim]Could not fetch {url}: {e}[/dim]")
+        return None
 
-            metadata = extract_metadata(response.text, url)
 
-            if include_summary:
-                page_text = extract_page_text(response.text)
-                # Store the raw text as "summary" - an LLM can process this later
-                metadata.summary = page_text[:2000]  # Truncate for storage
+async def fetch_url_metadata_async(
+    client: httpx.AsyncClient,
+    url: str,
+    include_summary: bool = False,
+) -> UrlMetadata | None:
+    """Fetch metadata for a URL with a shared async client; see fetch_url_metadata."""
+    if not should_enrich_url(url):
+        return None
 
-            return metadata
+    try:
+        response = await client.get(url)
+        response.raise_for_status()
+        return metadata_from_html(response.text, url, include_summary)
 
     except Exception as e:
         console.print(f"[dim]Could not fetch {url}: {e}[/dim]")
         return None
 
 
+def metadata_from_html(html: str, url: str, include_summary: bool = False) -> UrlMetadata:
+    """Build UrlMetadata from a fetched page."""
+    metadata = extract_metadata(html, url)
+
+    if include_summary:
+        page_text = extract_page_text(html)
+        # Store the raw text as "summary" - an LLM can process this later
+        metadata.summary = page_text[:2000]  # Truncate for storage
+
+    return metadata
+
+
 def enrich_bookmark(
     db: BookmarkDatabase,
     tweet_id: str,
@@ -170,20 +225,55 @@ def enrich_all_bookmarks(
     Returns:
         Total number of URLs enriched
     """
-    total_enriched = 0
-
-    # Get all bookmarks with URLs
-    for bookmark in db.get_all_bookmarks():
-        if not bookmark.urls:
-            continue
+    # Collect the work up front: updates made while a read on the shared
+    # connection is still open are not committed until that read finishes.
+    # Dicts rather than Bookmarks, so raw_json is never read or decompressed.
+    pending = [
+        (bookmark["tweet_id"], bookmark["urls"])
+        for bookmark in db.get_bookmark_dicts()
+        if bookmark["urls"] and not (only_unenriched and bookmark["url_metadata"])
+    ]
+    if not pending:
+        return 0
 
-        # Skip if already enriched
-        if only_unenriched and bookmark.url_metadata:
-            continue
+    return asyncio.run(_enrich_pending(db, pending, include_summary))
 
-        count = enrich_bookmark(db, bookmark.tweet_id, include_summary=include_summary)
-        if count > 0:
-            console.print(f"[dim]Enriched {count} URL(s) for tweet {bookmark.tweet_id}[/dim]")
-            total_enriched += count
 
-    return total_enriched
+async def _enrich_pending(
+    db: BookmarkDatabase,
+    pending: list[tuple[str, list[str]]],
+    include_summary: bool,
+) -> int:
+    """Fetch URLs concurrently over one client and store each bookmark's metadata."""
+    # A fixed pool of workers sharing one iterator, so only CONCURRENCY
+    # tasks (and requests) exist at a time however many bookmarks are pending
+    work = iter(pending)
+
+    async with httpx.AsyncClient(
+        timeout=TIMEOUT,
+        follow_redirects=True,
+        headers={"User-Agent": USER_AGENT},
+    ) as client:
+
+        async def enrich(tweet_id: str, urls: list[str]) -> int:
+            enriched_metadata = []
+            for url in urls:
+                metadata = await fetch_url_metadata_async(client, url, include_summary=include_summary)
+                if metadata:
+                    enriched_metadata.append(metadata)
+            if enriched_metadata:
+                # Runs on the event loop thread, between awaits
+                db.update_url_metadata(tweet_id, enriched_metadata)
+                console.print(f"[dim]Enriched {len(enriched_metadata)} URL(s) for tweet {tweet_id}[/dim]")
+            return len(enriched_metadata)
+
+        async def worker() -> int:
+            enriched = 0
+            # Safe to share: the event loop runs one worker at a time
+            for tweet_id, urls in work:
+                enriched += await enrich(tweet_id, urls)
+            return enriched
+
+        counts = await asyncio.gather(*(worker() for _ in range(min(CONCURRENCY, len(pending)))))
+
+    return sum(counts)
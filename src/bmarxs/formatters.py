@@ -1,75 +1,141 @@
-"""Output formatters for bookmarks (JSON, CSV, Markdown)."""
+"""Output formatters for bookmarks (JSON, JSON Lines, CSV, Markdown).
+
+Each format has an ``iter_*`` generator that yields output chunks one
+bookmark at a time, so callers can stream large exports without holding
+the whole payload in memory; ``write_bookmarks`` writes that stream
+straight to an open file.
+
+The JSON and CSV formats also accept ``Bookmark.to_dict()``-shaped dicts (see
+``BookmarkDatabase.get_bookmark_dicts``), which skips building Bookmark
+objects only to serialize them again, and JSON Lines accepts objects
+already encoded as strings (``BookmarkDatabase.get_bookmark_json``).
+"""
 
 import csv
 import json
 from io import StringIO
-from typing import Iterator
+from itertools import batched
+from typing import Iterable, Iterator, TextIO
 
 from .database import Bookmark
 
+CSV_HEADER = [
+    "tweet_id",
+    "author_id",
+    "author_username",
+    "author_name",
+    "text",
+    "created_at",
+    "bookmark_saved_at",
+    "media_urls",
+    "urls",
+    "processed",
+    "processed_at",
+    "url_metadata",
+]
 
-def format_json(bookmarks: Iterator[Bookmark], pretty: bool = True) -> str:
-    """Format bookmarks as JSON."""
-    bookmark_list = [b.to_dict() for b in bookmarks]
-    if pretty:
-        return json.dumps(bookmark_list, indent=2, ensure_ascii=False)
-    return json.dumps(bookmark_list, ensure_ascii=False)
+# Rows per CSV chunk: each chunk is written with one writerows() call
+CSV_BATCH_SIZE = 1000
 
+# Flatten newlines in tweet text so each bookmark stays on one CSV line
+NEWLINE_TO_SPACE = str.maketrans({"\n": " ", "\r": " "})
 
-def format_csv(bookmarks: Iterator[Bookmark]) -> str:
-    """Format bookmarks as CSV with all fields."""
-    output = StringIO()
-    writer = csv.writer(output)
+
+def _as_dict(bookmark: Bookmark | dict) -> dict:
+    """Get the to_dict() form of a bookmark, passing dicts through."""
+    return bookmark if isinstance(bookmark, dict) else bookmark.to_dict()
+
+
+def iter_json(
+    bookmarks: Iterable[Bookmark | dict], pretty: bool = True, ensure_ascii: bool = False
+) -> Iterator[str]:
+    """Yield a JSON array of bookmarks, one element per chunk."""
+    separator = ",\n" if pretty else ", "
+    first = True
+
+    for bookmark in bookmarks:
+        if pretty:
+            item = json.dumps(_as_dict(bookmark), indent=2, ensure_ascii=ensure_ascii)
+            # Nest the element one level inside the array
+            item = "  " + item.replace("\n", "\n  ")
+        else:
+            item = json.dumps(_as_dict(bookmark), ensure_ascii=ensure_ascii)
+
+        if first:
+            yield ("[\n" if pretty else "[") + item
+            first = False
+        else:
+            yield separator + item
+
+    if first:
+        yield "[]"
+    else:
+        yield "\n]" if pretty else "]"
+
+
+def iter_jsonl(bookmarks: Iterable[Bookmark | dict | str]) -> Iterator[str]:
+    """Yield bookmarks as JSON Lines (one compact object per line)."""
+    separator = ""
+    for bookmark in bookmarks:
+        if isinstance(bookmark, str):
+            yield separator + bookmark  # Already encoded
+        else:
+            yield separator + json.dumps(_as_dict(bookmark), ensure_ascii=False)
+        separator = "\n"
+
+
+def _csv_rows(bookmarks: Iterable[Bookmark | dict]) -> Iterator[tuple]:
+    """Yield one CSV row tuple per bookmark."""
+    for bookmark in bookmarks:
+        bookmark = _as_dict(bookmark)
+        url_metadata = bookmark["url_metadata"]
+        media_urls = bookmark["media_urls"]
+        urls = bookmark["urls"]
+
+        yield (
+            bookmark["tweet_id"],
+            bookmark["author_id"],
+            bookmark["author_username"],
+            bookmark["author_name"],
+            bookmark["text"].translate(NEWLINE_TO_SPACE),
+            bookmark["created_at"],
+            bookmark["bookmark_saved_at"],
+            "|".join(media_urls) if media_urls else "",
+            "|".join(urls) if urls else "",
+            "true" if bookmark["processed"] else "false",
+            bookmark["processed_at"] or "",
+            # Serialize url_metadata as JSON string for CSV
+            json.dumps(url_metadata) if url_metadata else "",
+        )
+
+
+def iter_csv(bookmarks: Iterable[Bookmark | dict]) -> Iterator[str]:
+    """Yield bookmarks as CSV with all fields, in chunks of CSV_BATCH_SIZE rows."""
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+
+    def flush() -> str:
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
 
     # Header - includes all fields
-    writer.writerow([
-        "tweet_id",
-        "author_id",
-        "author_username",
-        "author_name",
-        "text",
-        "created_at",
-        "bookmark_saved_at",
-        "media_urls",
-        "urls",
-        "processed",
-        "processed_at",
-        "url_metadata",
-    ])
+    writer.writerow(CSV_HEADER)
+    yield flush()
 
     # Data rows
-    for bookmark in bookmarks:
-        # Serialize url_metadata as JSON string for CSV
-        url_metadata_str = ""
-        if bookmark.url_metadata:
-            url_metadata_str = json.dumps([
-                {"url": m.url, "title": m.title, "description": m.description, "summary": m.summary}
-                for m in bookmark.url_metadata
-            ])
-
-        writer.writerow([
-            bookmark.tweet_id,
-            bookmark.author_id,
-            bookmark.author_username,
-            bookmark.author_name,
-            bookmark.text.replace("\n", " "),  # Flatten newlines for CSV
-            bookmark.created_at.isoformat(),
-            bookmark.bookmark_saved_at.isoformat(),
-            "|".join(bookmark.media_urls) if bookmark.media_urls else "",
-            "|".join(bookmark.urls) if bookmark.urls else "",
-            "true" if bookmark.processed else "false",
-            bookmark.processed_at.isoformat() if bookmark.processed_at else "",
-            url_metadata_str,
-        ])
-
-    return output.getvalue()
-
-
-def format_markdown(bookmarks: Iterator[Bookmark]) -> str:
-    """Format bookmarks as Markdown with all fields."""
-    lines = ["# X/Twitter Bookmarks\n"]
+    for rows in batched(_csv_rows(bookmarks), CSV_BATCH_SIZE):
+        writer.writerows(rows)
+        yield flush()
+
+
+def iter_markdown(bookmarks: Iterable[Bookmark]) -> Iterator[str]:
+    """Yield bookmarks as Markdown with all fields, one section per chunk."""
+    yield "# X/Twitter Bookmarks\n"
 
     for bookmark in bookmarks:
+        lines = []
         lines.append(f"## @{bookmark.author_username} ({bookmark.author_name})\n")
         lines.append(f"**Tweet ID:** {bookmark.tweet_id}  ")
         lines.append(f"**Created:** {bookmark.created_at.strftime('%Y-%m-%d %H:%M')}  ")
@@ -109,23 +175,53 @@ def format_markdown(bookmarks: Iterator[Bookmark]) -> str:
         lines.append(f"\n[View on X](https://x.com/{bookmark.author_username}/status/{bookmark.tweet_id})\n")
         lines.append("\n---\n\n")
 
-    return "".join(lines)
+        yield "".join(lines)
 
 
-def format_bookmarks(
-    bookmarks: Iterator[Bookmark],
-    format_type: str,
-) -> str:
-    """Format bookmarks in the specified format."""
-    # Convert iterator to list since we may need to iterate multiple times
-    # or the iterator might be exhausted
-    bookmark_list = list(bookmarks)
+def format_json(bookmarks: Iterable[Bookmark], pretty: bool = True) -> str:
+    """Format bookmarks as JSON."""
+    return "".join(iter_json(bookmarks, pretty=pretty))
+
+
+def format_csv(bookmarks: Iterable[Bookmark]) -> str:
+    """Format bookmarks as CSV with all fields."""
+    return "".join(iter_csv(bookmarks))
+
+
+def format_markdown(bookmarks: Iterable[Bookmark]) -> str:
+    """Format bookmarks as Markdown with all fields."""
+    return "".join(iter_markdown(bookmarks))
+
 
+def format_bookmarks_iter(
+    bookmarks: Iterable[Bookmark],
+    format_type: str,
+) -> Iterator[str]:
+    """Yield bookmarks in the specified format as a stream of chunks."""
     if format_type == "json":
-        return format_json(iter(bookmark_list))
+        return iter_json(bookmarks)
+    elif format_type == "jsonl":
+        return iter_jsonl(bookmarks)
     elif format_type == "csv":
-        return format_csv(iter(bookmark_list))
+        return iter_csv(bookmarks)
     elif format_type == "md" or format_type == "markdown":
-        return format_markdown(iter(bookmark_list))
+        return iter_markdown(bookmarks)
     else:
         raise ValueError(f"Unknown format: {format_type}")
+
+
+def format_bookmarks(
+    bookmarks: Iterable[Bookmark],
+    format_type: str,
+) -> str:
+    """Format bookmarks in the specified format."""
+    return "".join(format_bookmarks_iter(bookmarks, format_type))
+
+
+def write_bookmarks(
+    bookmarks: Iterable[Bookmark],
+    format_type: str,
+    out: TextIO,
+) -> None:
+    """Write bookmarks in the specified format to a file-like object."""
+    out.writelines(format_bookmarks_iter(bookmarks, format_type))
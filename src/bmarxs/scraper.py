@@ -1,15 +1,19 @@
 """Playwright-based scraper for X/Twitter bookmarks with GraphQL interception."""
 
-import json
+import queue
+import threading
 import time
-from datetime import datetime
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterator
 
 from playwright.sync_api import Page, Response, sync_playwright
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from rich.console import Console
+from rich.progress import Progress, SpinnerColumn, TaskID, TextColumn
 
-from .database import Bookmark, BookmarkDatabase
+from .database import Bookmark, BookmarkDatabase, dump_json
 
 console = Console()
 
@@ -25,11 +29,77 @@ BROWSER_CONTEXT_OPTIONS = {
     "timezone_id": "America/Los_Angeles",
 }
 
+# Scrolls to the bottom and returns the height it scrolled to, in one call
+SCROLL_TO_BOTTOM_JS = """() => {
+    const height = document.body.scrollHeight;
+    window.scrollTo(0, height);
+    return height;
+}"""
+
+# Twitter's created_at format: "Sat Jan 01 00:00:00 +0000 2022"
+TWITTER_DATE_FORMAT = "%a %b %d %H:%M:%S %z %Y"
+MONTHS = {
+    name: number
+    for number, name in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"),
+        start=1,
+    )
+}
+# UTC offsets seen so far; in practice created_at is always +0000
+_TIMEZONES = {"+0000": timezone.utc}
+
+
+def parse_twitter_date(value: str) -> datetime:
+    """Parse a Twitter created_at string, reading the fixed-position fields directly."""
+    try:
+        if len(value) != 30:
+            raise ValueError(value)
+        offset = value[20:25]
+        tz = _TIMEZONES.get(offset)
+        if tz is None:
+            sign = -1 if offset[0] == "-" else 1
+            delta = timedelta(hours=int(offset[1:3]), minutes=int(offset[3:5]))
+            tz = _TIMEZONES[offset] = timezone(sign * delta)
+        return datetime(
+            int(value[26:30]),
+            MONTHS[value[4:7]],
+            int(value[8:10]),
+            int(value[11:13]),
+            int(value[14:16]),
+            int(value[17:19]),
+            tzinfo=tz,
+        )
+    except (KeyError, ValueError):
+        # Not in the expected shape: let strptime parse it or raise
+        return datetime.strptime(value, TWITTER_DATE_FORMAT)
+
+
+def _bitrate(variant: dict) -> int:
+    """Sort key for video variants; some variants carry no bitrate."""
+    return variant.get("bitrate", 0)
+
+
+def _media_url(media: dict) -> str:
+    """Get a media item's URL: the image, or a video's highest-bitrate MP4."""
+    media_type = media.get("type")
+    if media_type == "photo":
+        return media.get("media_url_https", "")
+    if media_type in ("video", "animated_gif"):
+        variants = media.get("video_info", {}).get("variants", ())
+        best = max(
+            (v for v in variants if v.get("content_type") == "video/mp4"),
+            key=_bitrate,
+            default=None,
+        )
+        return best.get("url", "") if best else ""
+    return ""
+
 
 class BookmarkScraper:
     """Scrapes X/Twitter bookmarks using Playwright and GraphQL interception."""
 
     BOOKMARKS_URL = "https://x.com/i/bookmarks"
+    GRAPHQL_PREFIX = "https://x.com/i/api/graphql/"
     GRAPHQL_PATTERN = "Bookmarks"
 
     def __init__(
@@ -41,7 +111,6 @@ class BookmarkScraper:
         self.db = db
         self.session_path = session_path
         self.headless = headless
-        self._bookmarks_data: list[dict] = []
         self._stop_scraping = False
         self._last_data_time = 0.0
         self._last_scroll_height = 0
@@ -49,80 +118,144 @@ class BookmarkScraper:
         self._scroll_check_iterations = 2  # (reduced from 3)
         self._new_bookmarks_count = 0
         self._duplicate_found = False
+        self._known_ids: set[str] = set()
+        self._is_bookmarks_response = self._bookmarks_response_matcher()
+        # GraphQL responses waiting for the worker thread; None stops it
+        self._responses: queue.Queue[dict | None] = queue.Queue()
+        # Live count of saved bookmarks, shown while sync() runs
+        self._progress: Progress | None = None
+        self._progress_task: TaskID | None = None
 
     def _handle_response(self, response: Response) -> None:
         """Handle GraphQL responses containing bookmark data."""
         if self._stop_scraping:
             return
 
-        url = response.url
-        if self.GRAPHQL_PATTERN in url and response.status == 200:
+        if self._is_bookmarks_response(response):
             try:
                 data = response.json()
                 self._last_data_time = time.time()
-                self._process_bookmarks_response(data)
+                # Parsed and saved on the worker thread, so the browser's
+                # events aren't held up behind parsing and database writes
+                self._responses.put(data)
             except Exception as e:
                 console.print(f"[yellow]Warning: Failed to parse response: {e}[/yellow]")
 
+    @contextmanager
+    def _response_worker(self) -> Iterator[None]:
+        """Run a worker thread that processes queued responses, draining it on exit."""
+        worker = threading.Thread(target=self._process_responses, name="bmarxs-sync", daemon=True)
+        worker.start()
+        try:
+            yield
+        finally:
+            self._responses.put(None)
+            worker.join()
+
+    def _process_responses(self) -> None:
+        """Process queued GraphQL responses until the None sentinel arrives."""
+        while (data := self._responses.get()) is not None:
+            # Responses queued before a duplicate was found are dropped, as
+            # they were when the handler processed them inline
+            if not self._stop_scraping:
+                self._process_bookmarks_response(data)
+
+    @classmethod
+    def _bookmarks_response_matcher(cls) -> Callable[[Response], bool]:
+        """Build the check for successful bookmarks GraphQL responses."""
+        # Every response the page loads goes through this (media, scripts,
+        # telemetry): the URL parts are bound once as closure variables, and
+        # the prefix check rejects almost all responses up front
+        prefix = cls.GRAPHQL_PREFIX
+        pattern = cls.GRAPHQL_PATTERN
+
+        def is_bookmarks_response(response: Response) -> bool:
+            url = response.url
+            return url.startswith(prefix) and pattern in url and response.status == 200
+
+        return is_bookmarks_response
+
     def _process_bookmarks_response(self, data: dict) -> None:
         """Extract and save bookmarks from GraphQL response."""
         try:
             # Navigate the nested response structure
             # Structure: data.bookmark_timeline_v2.timeline.instructions[].entries[]
-            timeline = data.get("data", {}).get("bookmark_timeline_v2", {}).get("timeline", {})
-            instructions = timeline.get("instructions", [])
-
-            for instruction in instructions:
-                if instruction.get("type") == "TimelineAddEntries":
-                    entries = instruction.get("entries", [])
-                    for entry in entries:
-                        self._process_entry(entry)
+            try:
+                instructions = data["data"]["bookmark_timeline_v2"]["timeline"]["instructions"]
+            except (KeyError, TypeError):
+                return
 
-        except Exception as e:
-            console.print(f"[yellow]Warning: Error processing bookmark data: {e}[/yellow]")
+            # Keyed by tweet ID: drops repeats within the page, keeps order
+            bookmarks: dict[str, Bookmark] = {}
+            for entry, result in self._iter_tweet_results(instructions):
+                tweet_id = self._tweet_id(result, entry)
+
+                # Check if we already have this bookmark (for incremental
+                # sync) before parsing it: it and everything after it are
+                # already stored
+                if tweet_id in self._known_ids:
+                    self._duplicate_found = True
+                    self._stop_scraping = True
+                    console.print(
+                        f"[cyan]Found existing bookmark (tweet {tweet_id}), stopping sync[/cyan]"
+                    )
+                    break
 
-    def _process_entry(self, entry: dict) -> None:
-        """Process a single timeline entry."""
-        entry_id = entry.get("entryId", "")
+                if tweet_id in bookmarks:
+                    continue
 
-        # Skip cursor entries
-        if entry_id.startswith("cursor-"):
-            return
+                try:
+                    bookmarks[tweet_id] = self._parse_tweet(result, entry)
+                except Exception as e:
+                    console.print(f"[yellow]Warning: Failed to parse tweet: {e}[/yellow]")
 
-        content = entry.get("content", {})
-        item_content = content.get("itemContent", {})
-        tweet_results = item_content.get("tweet_results", {})
-        result = tweet_results.get("result", {})
+            self._save_page([*bookmarks.values()])
 
-        # Handle different result types
-        if result.get("__typename") == "TweetWithVisibilityResults":
-            result = result.get("tweet", {})
+        except Exception as e:
+            console.print(f"[yellow]Warning: Error processing bookmark data: {e}[/yellow]")
 
-        if not result or result.get("__typename") != "Tweet":
+    def _iter_tweet_results(self, instructions: list[dict]) -> Iterator[tuple[dict, dict]]:
+        """Yield (entry, tweet result) pairs for the tweet entries of a response."""
+        for instruction in instructions:
+            if instruction.get("type") != "TimelineAddEntries":
+                continue
+
+            for entry in instruction.get("entries", []):
+                # Skip cursor entries
+                if entry.get("entryId", "").startswith("cursor-"):
+                    continue
+
+                # A missing or null level means the entry isn't a tweet;
+                # skip it rather than fail the whole page
+                try:
+                    result = entry["content"]["itemContent"]["tweet_results"]["result"]
+                except (KeyError, TypeError):
+                    continue
+                if not result:
+                    continue
+
+                # Handle different result types
+                if result.get("__typename") == "TweetWithVisibilityResults":
+                    result = result.get("tweet", {})
+
+                if result and result.get("__typename") == "Tweet":
+                    yield entry, result
+
+    def _tweet_id(self, result: dict, entry: dict) -> str:
+        """Get a tweet's ID from its rest_id, falling back to the entry ID."""
+        return result.get("rest_id") or entry.get("entryId", "").replace("tweet-", "")
+
+    def _save_page(self, bookmarks: list[Bookmark]) -> None:
+        """Save one page of new bookmarks in a single transaction."""
+        if not bookmarks:
             return
 
-        try:
-            bookmark = self._parse_tweet(result, entry)
-
-            # Check if we already have this bookmark (for incremental sync)
-            if self.db.exists(bookmark.tweet_id):
-                self._duplicate_found = True
-                self._stop_scraping = True
-                console.print(
-                    f"[cyan]Found existing bookmark (tweet {bookmark.tweet_id}), stopping sync[/cyan]"
-                )
-                return
-
-            # Save the bookmark
-            if self.db.save_bookmark(bookmark):
-                self._new_bookmarks_count += 1
-                console.print(
-                    f"[green]Saved bookmark {self._new_bookmarks_count}: "
-                    f"@{bookmark.author_username}[/green]"
-                )
-
-        except Exception as e:
-            console.print(f"[yellow]Warning: Failed to parse tweet: {e}[/yellow]")
+        # Save the bookmarks
+        saved = self.db.save_bookmarks(bookmarks)
+        self._known_ids.update(bookmark.tweet_id for bookmark in bookmarks)
+        self._new_bookmarks_count += saved
+        if self._progress is not None:
+            self._progress.update(self._progress_task, completed=self._new_bookmarks_count)
 
     def _parse_tweet(self, result: dict, entry: dict) -> Bookmark:
         """Parse a tweet result into a Bookmark object."""
@@ -133,37 +266,29 @@ class BookmarkScraper:
         user_core = user_results.get("core", {})
         user_legacy = user_results.get("legacy", {})
 
-        # Extract tweet ID from rest_id or entry_id
-        tweet_id = result.get("rest_id") or entry.get("entryId", "").replace("tweet-", "")
+        tweet_id = self._tweet_id(result, entry)
 
         # Parse created_at
         created_at_str = legacy.get("created_at", "")
         if created_at_str:
-            # Twitter format: "Sat Jan 01 00:00:00 +0000 2022"
-            created_at = datetime.strptime(created_at_str, "%a %b %d %H:%M:%S %z %Y")
+            created_at = parse_twitter_date(created_at_str)
         else:
             created_at = datetime.now()
 
         # Extract media URLs
-        media_urls = []
         extended_entities = legacy.get("extended_entities", {})
-        for media in extended_entities.get("media", []):
-            if media.get("type") == "photo":
-                media_urls.append(media.get("media_url_https", ""))
-            elif media.get("type") in ("video", "animated_gif"):
-                variants = media.get("video_info", {}).get("variants", [])
-                # Get highest bitrate video
-                video_variants = [v for v in variants if v.get("content_type") == "video/mp4"]
-                if video_variants:
-                    best = max(video_variants, key=lambda x: x.get("bitrate", 0))
-                    media_urls.append(best.get("url", ""))
+        media_urls = [
+            media_url
+            for media in extended_entities.get("media", ())
+            if (media_url := _media_url(media))
+        ]
 
         # Extract URLs
-        urls = []
-        for url_entity in legacy.get("entities", {}).get("urls", []):
-            expanded = url_entity.get("expanded_url", "")
-            if expanded:
-                urls.append(expanded)
+        urls = [
+            expanded
+            for url_entity in legacy.get("entities", {}).get("urls", ())
+            if (expanded := url_entity.get("expanded_url"))
+        ]
 
         return Bookmark(
             tweet_id=tweet_id,
@@ -173,7 +298,7 @@ class BookmarkScraper:
             text=legacy.get("full_text", ""),
             created_at=created_at,
             bookmark_saved_at=datetime.now(),
-            raw_json=json.dumps(result),
+            raw_json=dump_json(result),
             media_urls=media_urls if media_urls else None,
             urls=urls if urls else None,
         )
@@ -204,10 +329,18 @@ class BookmarkScraper:
 
         Returns True if more content might be available.
         """
-        current_height = page.evaluate("document.body.scrollHeight")
-        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        page.wait_for_timeout(1500)  # Wait for content to load
-
+        # Return as soon as the scroll brings in the next page of bookmarks
+        try:
+            with page.expect_response(
+                self._is_bookmarks_response,
+                timeout=self._no_new_data_timeout * 1000,
+            ):
+                current_height = page.evaluate(SCROLL_TO_BOTTOM_JS)
+            return True
+        except PlaywrightTimeoutError:
+            pass
+
+        # No new page arrived: fall back to whether the page still grew
         new_height = page.evaluate("document.body.scrollHeight")
         height_changed = new_height > current_height
 
@@ -232,11 +365,12 @@ class BookmarkScraper:
         Returns:
             Number of new bookmarks saved.
         """
-        self._bookmarks_data = []
         self._stop_scraping = False
         self._new_bookmarks_count = 0
         self._duplicate_found = False
         self._last_data_time = time.time()
+        # Checked in memory for every parsed tweet instead of querying
+        self._known_ids = self.db.get_all_tweet_ids()
 
         # If not syncing all, we'll stop at the first duplicate
         if not sync_all:
@@ -259,7 +393,20 @@ class BookmarkScraper:
                 "Make sure you're logged into X/Twitter in Chrome before importing."
             )
 
-        with sync_playwright() as p:
+        # One progress line updated per saved page, rather than a printed
+        # line per bookmark; the worker drains before the display stops
+        with (
+            Progress(
+                SpinnerColumn(),
+                TextColumn("[green]Saved {task.completed} bookmarks[/green]"),
+                console=console,
+            ) as progress,
+            self._response_worker(),
+            sync_playwright() as p,
+        ):
+            self._progress = progress
+            self._progress_task = progress.add_task("sync", total=None)
+
             # Use real Chrome to avoid bot detection (not Chromium for Testing)
             browser = p.chromium.launch(
                 headless=self.headless,